@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Serialization benchmark for large JSON responses
+Compares FastAPI's default JSON response with ORJSONResponse end to end
+(jsonable_encoder + render), and measures gzip time and savings on book-sized
+payloads at the compression level used by main.py.
+Does not need a running server.
+Run with: python benchmark_serialization.py
+"""
+
+import gzip
+import itertools
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+# JSONGZipMiddleware in main.py uses compresslevel=1
+GZIP_COMPRESSLEVEL = 1
+
+# Pseudo-words with a Zipf frequency distribution, so the text compresses about
+# like real English prose (2.5-3x with gzip) rather than a tiny repeated vocabulary
+ONSETS = ["", "b", "br", "c", "ch", "d", "f", "g", "h", "l", "m", "n", "p", "pr", "r", "s", "sh", "st", "t", "th", "tr", "v", "w"]
+VOWELS = ["a", "e", "i", "o", "u", "ea", "ou", "ai"]
+CODAS = ["", "", "n", "r", "s", "t", "l", "nd", "st", "ng", "ck"]
+
+def make_word() -> str:
+    """Build a pronounceable word of one to three syllables"""
+    syllables = random.choice([1, 1, 2, 2, 3])
+    return "".join(random.choice(ONSETS) + random.choice(VOWELS) + random.choice(CODAS) for _ in range(syllables))
+
+random.seed(7)
+VOCABULARY = list(dict.fromkeys(make_word() for _ in range(8000)))
+ZIPF_WEIGHTS = list(itertools.accumulate(1 / rank for rank in range(1, len(VOCABULARY) + 1)))
+
+def make_text(n_words: int) -> str:
+    """Generate pseudo-prose of n_words words with sentences and commas"""
+    words = []
+    capitalize = True
+    for word in random.choices(VOCABULARY, cum_weights=ZIPF_WEIGHTS, k=n_words):
+        words.append(word.capitalize() if capitalize else word)
+        capitalize = False
+        roll = random.random()
+        if roll < 0.06:
+            words[-1] += "."
+            capitalize = True
+        elif roll < 0.12:
+            words[-1] += ","
+    return " ".join(words)
+
+def make_payloads() -> dict:
+    """Build payloads shaped like the largest API responses (see API_Documentation.md)"""
+    random.seed(42)
+    now = datetime.now(timezone.utc)
+    book_id = uuid.uuid4()
+    user_id = uuid.uuid4()
+
+    # 300 pages split into 4 chunks each, as returned with the book details
+    book_details = {
+        "success": True,
+        "message": "Book retrieved successfully",
+        "book": {
+            "id": book_id,
+            "user_id": user_id,
+            "title": "Pride and Prejudice",
+            "description": make_text(40),
+            "book_language": "en",
+            "created_at": now,
+            "embedding_count": 1200,
+            "page_count": 300,
+            "is_demo": False,
+        },
+        "embeddings": [
+            {"id": uuid.uuid4(), "page_no": page, "chunk_no": chunk, "content": make_text(110)}
+            for page in range(1, 301)
+            for chunk in range(4)
+        ],
+    }
+    single_page = {
+        "success": True,
+        "message": "Page retrieved successfully",
+        "book_id": book_id,
+        "page_no": 42,
+        "content": make_text(450),
+        "content_length": 2700,
+    }
+    chat_history = {
+        "history": [
+            {"role": "user" if i % 2 == 0 else "bot", "content": make_text(60 if i % 2 == 0 else 250)}
+            for i in range(200)
+        ],
+        "agent_type": "book",
+    }
+    sticky_notes = {
+        "success": True,
+        "message": "Retrieved 500 sticky notes",
+        "notes": [
+            {
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "book_id": book_id,
+                "page_number": random.randint(1, 300),
+                "selected_text": make_text(30),
+                "tool_output": make_text(120),
+                "tool_type": "translation",
+                "color": "yellow",
+                "coordinates": {"x": 120, "y": 340},
+                "created_at": now,
+                "updated_at": now,
+            }
+            for _ in range(500)
+        ],
+        "total_notes": 500,
+    }
+    return {
+        "GET /books/{book_id}": book_details,
+        "GET /books/{book_id}/page/{page_no}": single_page,
+        "GET /api/chatHistory": chat_history,
+        "GET /sticky-notes/book/{book_id}": sticky_notes,
+    }
+
+def json_response(content) -> bytes:
+    """Previous default: jsonable_encoder followed by JSONResponse.render"""
+    return JSONResponse(jsonable_encoder(content)).body
+
+def orjson_response(content) -> bytes:
+    """New default: jsonable_encoder followed by ORJSONResponse.render"""
+    return ORJSONResponse(jsonable_encoder(content)).body
+
+def gzip_body(body: bytes) -> bytes:
+    """Compress a rendered body the way JSONGZipMiddleware does"""
+    return gzip.compress(body, compresslevel=GZIP_COMPRESSLEVEL)
+
+def time_it(fn, content, repeat: int = 20) -> float:
+    """Return the best time in milliseconds over repeat runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(content)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def main():
+    print("🚀 DuoRead response serialization benchmark")
+    print("=" * 100)
+    print(f"{'Endpoint':<38}{'json ms':>10}{'orjson ms':>11}{'speedup':>9}{'gzip ms':>10}{'raw KB':>10}{'gzip KB':>10}")
+    print("-" * 100)
+
+    for name, content in make_payloads().items():
+        body = orjson_response(content)
+        assert json.loads(body) == json.loads(json_response(content))
+
+        json_ms = time_it(json_response, content)
+        orjson_ms = time_it(orjson_response, content)
+        gzip_ms = time_it(gzip_body, body)
+        compressed = gzip_body(body)
+
+        print(
+            f"{name:<38}{json_ms:>10.2f}{orjson_ms:>11.2f}{json_ms / orjson_ms:>8.1f}x{gzip_ms:>10.2f}"
+            f"{len(body) / 1024:>10.1f}{len(compressed) / 1024:>10.1f}"
+        )
+
+    print("=" * 100)
+
+if __name__ == "__main__":
+    main()
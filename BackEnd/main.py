@@ -1,16 +1,83 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+import anyio.to_thread
 from routes.health_check_routes import health_check_router
 from routes.chat_routes import chat_router
 from routes.auth_routes import auth_router
 from routes.book_routes import book_router
 from routes.sticky_note_routes import sticky_note_router
 from configurations.postgres_db import create_tables
+import functools
+import gzip
 import logging
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+
+class JSONGZipMiddleware:
+    """Gzip JSON responses only; PDFs, SSE streams and other bodies pass through untouched."""
+
+    def __init__(self, app, minimum_size: int = 1000, compresslevel: int = 1, threadpool_size: int = 64 * 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+        # Bodies at least this large are compressed in a worker thread to keep the event loop free
+        self.threadpool_size = threadpool_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or "gzip" not in Headers(scope=scope).get("accept-encoding", ""):
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        compress = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, compress
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                compress = (
+                    headers.get("content-type", "").startswith("application/json")
+                    and "content-encoding" not in headers
+                )
+                if not compress:
+                    await send(message)
+                    return
+                # Hold the start message until the body size is known
+                start_message = message
+                return
+
+            if not compress or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            compress = False
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < self.minimum_size:
+                # Streamed or small JSON is sent as is
+                await send(start_message)
+                await send(message)
+                return
+
+            compress_body = functools.partial(gzip.compress, body, compresslevel=self.compresslevel)
+            if len(body) >= self.threadpool_size:
+                body = await anyio.to_thread.run_sync(compress_body)
+            else:
+                body = compress_body()
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            headers["Content-Encoding"] = "gzip"
+            headers["Content-Length"] = str(len(body))
+            await send(start_message)
+            await send({**message, "body": body})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+# Serialize JSON responses with orjson (book pages, chat history and notes are text-heavy)
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Add CORS middleware to allow all origins
 app.add_middleware(
@@ -21,6 +88,10 @@ app.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
+# Compress JSON responses above 1 KB for clients that accept gzip
+# (level 1: ~5x cheaper than level 6 on book text for ~20% larger output, see benchmark_serialization.py)
+app.add_middleware(JSONGZipMiddleware, minimum_size=1000, compresslevel=1)
+
 # Create database tables on startup
 @app.on_event("startup")
 async def startup_event():
@@ -37,6 +37,8 @@ interface BookLibraryProps {
 
 const API_BASE = "https://zainattiq-duoread.hf.space";
 const MAX_FILE_SIZE = 10 * 1024 * 1024; // 10MB in bytes
+const STATUS_POLL_INITIAL_MS = 3000; // First status check after 3 seconds
+const STATUS_POLL_MAX_MS = 30000; // Back off to at most one check every 30 seconds
 
 // Helper function to format file size
 const formatFileSize = (bytes: number): string => {
@@ -97,6 +99,7 @@ export const BookLibrary = ({ onSelectBook, onBooksLoaded, setFirstBookId }: Boo
   const [processingBooks, setProcessingBooks] = useState<Set<string>>(new Set());
   const [isCheckingStatuses, setIsCheckingStatuses] = useState(false);
   const pollingIntervalsRef = useRef<Map<string, NodeJS.Timeout>>(new Map());
+  const visibilityListenersRef = useRef<Map<string, () => void>>(new Map());
 
   const fetchBooks = async () => {
     if (!token) return;
@@ -181,8 +184,16 @@ export const BookLibrary = ({ onSelectBook, onBooksLoaded, setFirstBookId }: Boo
     
     setProcessingBooks(prev => new Set(prev).add(bookId));
     
-    const interval = setInterval(async () => {
+    let delay = STATUS_POLL_INITIAL_MS;
+    let inFlight = false;
+
+    const poll = async () => {
+      // Pause while the tab is hidden, the visibility listener resumes polling
+      if (document.hidden) return;
+
+      inFlight = true;
       const statusData = await checkBookStatus(bookId);
+      inFlight = false;
       
       if (statusData) {
         console.log(`Status for book ${bookId}:`, statusData); // Debug log
@@ -209,12 +220,31 @@ export const BookLibrary = ({ onSelectBook, onBooksLoaded, setFirstBookId }: Boo
           toast.success(`"${statusData.title || 'Book'}" is ready for reading!`);
           // Refresh books list to get the latest data
           await fetchBooks();
+          return;
         }
       }
-    }, 3000); // Poll every 3 seconds
+
+      // Polling was stopped while the request was in flight
+      if (!pollingIntervalsRef.current.has(bookId)) return;
+
+      // Large books take minutes to process, so poll less often the longer it runs
+      delay = Math.min(delay * 1.5, STATUS_POLL_MAX_MS);
+      pollingIntervalsRef.current.set(bookId, setTimeout(poll, delay));
+    };
+
+    // Check right away with a fresh backoff when the reader comes back to the tab
+    const handleVisibilityChange = () => {
+      if (document.hidden || !pollingIntervalsRef.current.has(bookId)) return;
+      delay = STATUS_POLL_INITIAL_MS;
+      if (inFlight) return; // The running poll schedules the next one
+      clearTimeout(pollingIntervalsRef.current.get(bookId));
+      poll();
+    };
+    visibilityListenersRef.current.set(bookId, handleVisibilityChange);
+    document.addEventListener("visibilitychange", handleVisibilityChange);
     
-    // Store interval in ref
-    pollingIntervalsRef.current.set(bookId, interval);
+    // Store timeout in ref
+    pollingIntervalsRef.current.set(bookId, setTimeout(poll, delay));
   };
 
   const stopStatusPolling = (bookId: string) => {
@@ -222,9 +252,14 @@ export const BookLibrary = ({ onSelectBook, onBooksLoaded, setFirstBookId }: Boo
     const interval = pollingIntervalsRef.current.get(bookId);
     if (interval) {
       console.log(`Clearing interval for book ${bookId}`);
-      clearInterval(interval);
+      clearTimeout(interval);
       pollingIntervalsRef.current.delete(bookId);
     }
+    const handleVisibilityChange = visibilityListenersRef.current.get(bookId);
+    if (handleVisibilityChange) {
+      document.removeEventListener("visibilitychange", handleVisibilityChange);
+      visibilityListenersRef.current.delete(bookId);
+    }
     setProcessingBooks(prev => {
       const newSet = new Set(prev);
       newSet.delete(bookId);
@@ -427,9 +462,13 @@ export const BookLibrary = ({ onSelectBook, onBooksLoaded, setFirstBookId }: Boo
   useEffect(() => {
     return () => {
       pollingIntervalsRef.current.forEach((interval) => {
-        clearInterval(interval);
+        clearTimeout(interval);
       });
       pollingIntervalsRef.current.clear();
+      visibilityListenersRef.current.forEach((handleVisibilityChange) => {
+        document.removeEventListener("visibilitychange", handleVisibilityChange);
+      });
+      visibilityListenersRef.current.clear();
     };
   }, []);
 
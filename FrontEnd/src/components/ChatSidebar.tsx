@@ -9,7 +9,7 @@ import axios from "axios";
 import { useAuth } from "@/contexts/AuthContext";
 import ReactMarkdown from "react-markdown";
 import remarkGfm from "remark-gfm";
-import { useStreamingAI } from "@/hooks/useStreamingAI";
+import { useStreamingAI, isAbortError } from "@/hooks/useStreamingAI";
 
 const API_BASE = "https://zainattiq-duoread.hf.space";
 
@@ -104,6 +104,8 @@ export const ChatSidebar = ({ bookId, additionalContext, onClose, onContextUsed,
     setLoading(true);
     reset(); // Reset streaming state
 
+    let aborted = false;
+
     try {
       const context = additionalContext.join("\n\n");
       
@@ -125,10 +127,15 @@ export const ChatSidebar = ({ bookId, additionalContext, onClose, onContextUsed,
         onContextUsed();
       }
     } catch (error) {
+      if (isAbortError(error)) {
+        // Stream was cancelled by closing the chat, leave the UI alone
+        aborted = true;
+        return;
+      }
       toast.error("Failed to send message");
       console.error("Chat error:", error);
     } finally {
-      setLoading(false);
+      if (!aborted) setLoading(false);
     }
   };
 
@@ -19,7 +19,7 @@ import axios from "axios";
 import { useAuth } from "@/contexts/AuthContext";
 import { SaveStickyNoteModal } from "./SaveStickyNoteModal";
 import { StickyNoteColor, StickyNoteToolType } from "@/types/stickyNote";
-import { useStreamingAI } from "@/hooks/useStreamingAI";
+import { useStreamingAI, isAbortError } from "@/hooks/useStreamingAI";
 import { 
   getBCP47Code, 
   isTranslatorAPIAvailable,
@@ -627,6 +627,8 @@ Definition:`;
       setLoadingMessage(isSingleWord ? "Translating word..." : "Translating...");
     }, 1000);
 
+    let aborted = false;
+
     try {
       if (processingMode === 'client') {
         // Check if Chrome Translator API is available
@@ -655,11 +657,16 @@ Definition:`;
       }
       setLoadingMessage("");
     } catch (error) {
+      if (isAbortError(error)) {
+        // Stream was cancelled by a newer request or by closing the popup, leave the UI alone
+        aborted = true;
+        return;
+      }
       console.error("Translation error:", error);
       toast.error("Translation failed");
       setShowResult(false);
     } finally {
-      setLoading(false);
+      if (!aborted) setLoading(false);
     }
   };
 
@@ -739,6 +746,7 @@ Definition:`;
       // Clean up translator
       translator.destroy();
     } catch (error) {
+      if (isAbortError(error)) throw error;
       console.error("Translation failed:", error);
       throw error;
     }
@@ -780,6 +788,7 @@ Definition:`;
         });
       }
     } catch (error) {
+      if (isAbortError(error)) throw error;
       console.error("Backend translation failed:", error);
       throw error;
     }
@@ -796,6 +805,8 @@ Definition:`;
     setLoadingMessage("Reading text...");
     reset(); // Reset streaming state
     
+    let aborted = false;
+
     try {
       if (processingMode === 'client') {
         // Check if Chrome Rewriter API is available
@@ -820,11 +831,16 @@ Definition:`;
       }
       setLoadingMessage("");
     } catch (error) {
+      if (isAbortError(error)) {
+        // Stream was cancelled by a newer request or by closing the popup, leave the UI alone
+        aborted = true;
+        return;
+      }
       console.error("Simplify error:", error);
       toast.error("Simplification failed");
       setShowResult(false);
     } finally {
-      setLoading(false);
+      if (!aborted) setLoading(false);
     }
   };
 
@@ -974,6 +990,7 @@ Definition:`;
       });
       setShowResult(true);
     } catch (error) {
+      if (isAbortError(error)) throw error;
       console.error("Backend simplify error:", error);
       console.error("Error details:", error.message);
       if (error.response) {
@@ -995,6 +1012,8 @@ Definition:`;
     setLoadingMessage("Reading text...");
     reset(); // Reset streaming state
     
+    let aborted = false;
+
     try {
       if (processingMode === 'client') {
         // Check if Chrome Writer API is available
@@ -1019,11 +1038,16 @@ Definition:`;
       }
       setLoadingMessage("");
     } catch (error) {
+      if (isAbortError(error)) {
+        // Stream was cancelled by a newer request or by closing the popup, leave the UI alone
+        aborted = true;
+        return;
+      }
       console.error("Explain error:", error);
       toast.error("Explanation failed");
       setShowResult(false);
     } finally {
-      setLoading(false);
+      if (!aborted) setLoading(false);
     }
   };
 
@@ -1175,6 +1199,7 @@ Definition:`;
       });
       setShowResult(true);
     } catch (error) {
+      if (isAbortError(error)) throw error;
       console.error("Backend explain error:", error);
       console.error("Error details:", error.message);
       if (error.response) {
@@ -1196,6 +1221,8 @@ Definition:`;
     setLoadingMessage("Reading text...");
     reset(); // Reset streaming state
     
+    let aborted = false;
+
     try {
       if (processingMode === 'client') {
         // Check if Chrome Summarizer API is available
@@ -1220,11 +1247,16 @@ Definition:`;
       }
       setLoadingMessage("");
     } catch (error) {
+      if (isAbortError(error)) {
+        // Stream was cancelled by a newer request or by closing the popup, leave the UI alone
+        aborted = true;
+        return;
+      }
       console.error("Summarize error:", error);
       toast.error("Summarization failed");
       setShowResult(false);
     } finally {
-      setLoading(false);
+      if (!aborted) setLoading(false);
     }
   };
 
@@ -1375,6 +1407,7 @@ Definition:`;
       });
       setShowResult(true);
     } catch (error) {
+      if (isAbortError(error)) throw error;
       console.error("Backend summarize error:", error);
       console.error("Error details:", error.message);
       if (error.response) {
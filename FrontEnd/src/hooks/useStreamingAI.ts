@@ -1,4 +1,4 @@
-import { useState, useCallback } from 'react';
+import { useState, useCallback, useRef, useEffect } from 'react';
 
 interface StreamingAIState {
   isStreaming: boolean;
@@ -11,16 +11,35 @@ interface StreamingAIActions {
   reset: () => void;
 }
 
+// True for the rejection of a stream that was cancelled (superseded, reset or unmounted)
+export const isAbortError = (err: unknown): boolean =>
+  err instanceof DOMException && err.name === 'AbortError';
+
 export const useStreamingAI = (): StreamingAIState & StreamingAIActions => {
   const [isStreaming, setIsStreaming] = useState(false);
   const [streamedText, setStreamedText] = useState('');
   const [error, setError] = useState<string | null>(null);
+  // Controller for the in-flight stream, aborted when superseded, reset or unmounted
+  const abortControllerRef = useRef<AbortController | null>(null);
+
+  useEffect(() => {
+    return () => {
+      abortControllerRef.current?.abort();
+    };
+  }, []);
 
   const streamResponse = useCallback(async (endpoint: string, data: any, token: string): Promise<string> => {
+    // Closing the connection lets the server cancel the upstream LLM call
+    abortControllerRef.current?.abort();
+    const controller = new AbortController();
+    abortControllerRef.current = controller;
+
     setIsStreaming(true);
     setStreamedText('');
     setError(null);
 
+    let fullText = '';
+
     try {
       const response = await fetch(`https://zainattiq-duoread.hf.space${endpoint}`, {
         method: 'POST',
@@ -28,7 +47,8 @@ export const useStreamingAI = (): StreamingAIState & StreamingAIActions => {
           'Content-Type': 'application/json',
           'Authorization': `Bearer ${token}`
         },
-        body: JSON.stringify(data)
+        body: JSON.stringify(data),
+        signal: controller.signal
       });
 
       if (!response.ok) {
@@ -39,7 +59,6 @@ export const useStreamingAI = (): StreamingAIState & StreamingAIActions => {
       if (!reader) throw new Error('No reader available');
 
       const decoder = new TextDecoder();
-      let fullText = '';
 
       while (true) {
         const { done, value } = await reader.read();
@@ -77,6 +96,10 @@ export const useStreamingAI = (): StreamingAIState & StreamingAIActions => {
       setIsStreaming(false);
       return fullText;
     } catch (err) {
+      if (controller.signal.aborted) {
+        // Cancelled on purpose: reject without touching state, a newer stream may own it
+        throw new DOMException('Stream aborted', 'AbortError');
+      }
       const errorMessage = err instanceof Error ? err.message : 'Unknown error';
       setError(errorMessage);
       setIsStreaming(false);
@@ -85,6 +108,8 @@ export const useStreamingAI = (): StreamingAIState & StreamingAIActions => {
   }, []);
 
   const reset = useCallback(() => {
+    abortControllerRef.current?.abort();
+    abortControllerRef.current = null;
     setIsStreaming(false);
     setStreamedText('');
     setError(null);